@@ -16,6 +16,14 @@ DB_NAME = os.getenv("DB_NAME", "northwind")
 # SQLAlchemy Database URL
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+# Connection pool per worker process; total connections are
+# API_WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+# Number of uvicorn worker processes
+API_WORKERS = int(os.getenv("API_WORKERS", "2"))
+
 # API Configuration
 API_TITLE = "Northwind Microserver API"
 API_VERSION = "1.0.0"
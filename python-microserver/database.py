@@ -1,17 +1,23 @@
 """
 Database connection and session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
-from config import DATABASE_URL
+from config import DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW
 
 # Create engine
 engine = create_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL query logging
+    future=True,
+    pool_size=DB_POOL_SIZE,  # Persistent connections kept in the pool
+    max_overflow=DB_MAX_OVERFLOW,  # Extra connections allowed under burst load
+    pool_timeout=30,  # Seconds to wait for a free connection
     pool_pre_ping=True,  # Verify connections before using
     pool_recycle=3600,  # Recycle connections after 1 hour
+    isolation_level="READ COMMITTED",  # Avoid gap locks on reads
+    query_cache_size=1200,  # Compiled statements kept across sessions
 )
 
 # Create session factory
@@ -21,6 +27,20 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def warm_connection_pool() -> int:
+    """
+    Open pool_size connections up front so first requests skip the handshake
+    """
+    conns = [engine.connect() for _ in range(engine.pool.size())]
+    try:
+        for conn in conns:
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in conns:
+            conn.close()
+    return len(conns)
+
+
 def get_db() -> Session:
     """
     Dependency injection for database session
@@ -3,20 +3,55 @@ FastAPI Microserver for Northwind Database
 Auto-generated CRUD endpoints for all tables
 """
 from fastapi import FastAPI, Depends, HTTPException, Query
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import inspect, func, text
-from typing import List, Dict, Any, Optional
+from sqlalchemy import func, text, select, update, UniqueConstraint
+from typing import List, Dict, Any, Optional, Tuple, Callable, FrozenSet, Iterator
+from functools import lru_cache
+from datetime import timedelta
+from decimal import Decimal
+import asyncio
 import logging
-
-from config import API_TITLE, API_VERSION, API_DESCRIPTION, DATABASE_URL
-from database import get_db, engine
-from models import get_all_tables, get_model_class
+import threading
+import orjson
+from cachetools import TTLCache
+from pydantic import TypeAdapter
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # brotli-asgi is optional
+    BrotliMiddleware = None
+
+from config import API_TITLE, API_VERSION, API_DESCRIPTION, DATABASE_URL, DB_NAME
+from database import get_db, engine, warm_connection_pool, SessionLocal
+from models import get_all_tables, get_model_class, get_table
 from schemas import GenericResponse, ErrorResponse
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+# Pydantic's JSON encoder, so orjson output matches GenericResponse responses
+_PYDANTIC_JSON = TypeAdapter(Any)
+
+
+def _orjson_default(value: Any) -> Any:
+    """Encode MySQL column types that orjson does not handle natively"""
+    if isinstance(value, (Decimal, timedelta)):
+        # Decimal as a string, timedelta as an ISO 8601 duration, as pydantic does
+        return _PYDANTIC_JSON.dump_python(value, mode="json")
+    raise TypeError
+
+
+class APIResponse(ORJSONResponse):
+    """orjson response that encodes DECIMAL and TIME column values like pydantic"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=API_TITLE,
@@ -24,50 +59,278 @@ app = FastAPI(
     description=API_DESCRIPTION,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=APIResponse,
 )
 
-# Store available tables
+# Compress large responses; Brotli falls back to gzip for clients without it
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, minimum_size=1024, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Store available tables (list keeps response order, set is for lookups)
 AVAILABLE_TABLES = []
+AVAILABLE_TABLES_SET: FrozenSet[str] = frozenset()
+
+# Background startup task, referenced so it is not garbage collected
+_WARMUP_TASK: Optional["asyncio.Task[None]"] = None
+
+# Reported with 503 until the table list is loaded; set on shutdown to stop retrying
+DATABASE_STATUS = "Database is warming up"
+STARTUP_RETRY_SECONDS = 5
+_SHUTDOWN = threading.Event()
+
+# Table metadata cache, populated once at startup (schema is static)
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {}
+TABLE_PKS: Dict[str, Tuple[str, ...]] = {}
+TABLE_COLUMN_INFO: Dict[str, List[Dict[str, Any]]] = {}
+TABLE_FKS: Dict[str, List[Dict[str, Any]]] = {}
+TABLE_COL_SETS: Dict[str, FrozenSet[str]] = {}
+TABLE_UNIQUE_COLS: Dict[str, FrozenSet[str]] = {}
+
+# Short-lived read caches; writes invalidate items and bump the table version
+ITEM_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+LIST_CACHE: TTLCache = TTLCache(maxsize=1_000, ttl=30)
+TABLE_VERSIONS: Dict[str, int] = {}
+SCHEMA_CACHE: Dict[str, Dict[str, Any]] = {}
+COUNT_CACHE: TTLCache = TTLCache(maxsize=1_000, ttl=300)
+CACHE_LOCK = threading.Lock()
+
+# Rows fetched per round-trip by the streaming endpoint
+STREAM_BATCH_SIZE = 500
+
+# Tables estimated below this size get an exact COUNT(*) instead
+EXACT_COUNT_THRESHOLD = 10_000
+
+
+def _decode_binary(value: Any) -> Any:
+    """Decode a binary column value to text"""
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', errors='ignore')
+    return value
 
 
 def serialize_row(row: Any, columns: List[str]) -> Dict[str, Any]:
     """Convert SQLAlchemy row to dictionary"""
-    result = {}
-    for col in columns:
-        value = getattr(row, col, None)
-        if value is None:
-            result[col] = None
-        elif isinstance(value, (bytes, bytearray)):
-            result[col] = value.decode('utf-8', errors='ignore')
+    # Loaded attributes live in the instance __dict__; fall back to getattr otherwise
+    d = row.__dict__
+    return {
+        col: _decode_binary(d[col] if col in d else getattr(row, col, None))
+        for col in columns
+    }
+
+
+def _may_be_binary(col_type: Any) -> bool:
+    """Whether a column type can yield bytes; unknown types are checked at runtime"""
+    try:
+        return col_type.python_type is bytes
+    except NotImplementedError:
+        return True
+
+
+@lru_cache(maxsize=None)
+def _row_serializer(table_name: str) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Build a serializer for result mappings of a table
+    The generated function is a single dict literal, decoding only binary columns
+    """
+    table = get_table(table_name)
+    if table is None:
+        raise KeyError(f"Table '{table_name}' is not reflected")
+    fields = []
+    for col in table.columns:
+        key = repr(col.name)
+        if _may_be_binary(col.type):
+            fields.append(f"{key}: _decode_binary(r[{key}])")
         else:
-            result[col] = value
-    return result
+            fields.append(f"{key}: r[{key}]")
+    source = "def serialize(r):\n    return {" + ", ".join(fields) + "}\n"
+    namespace = {"_decode_binary": _decode_binary}
+    exec(source, namespace)
+    return namespace["serialize"]
+
+
+def invalidate_table_cache(table_name: str, record_id: Any = None) -> None:
+    """Drop a cached record and invalidate cached pages for a table"""
+    with CACHE_LOCK:
+        TABLE_VERSIONS[table_name] = TABLE_VERSIONS.get(table_name, 0) + 1
+        COUNT_CACHE.pop(table_name, None)
+        if record_id is not None:
+            ITEM_CACHE.pop((table_name, str(record_id)), None)
+
+
+def approximate_count(db: Session, table_name: str, table: Any) -> int:
+    """
+    Get a cached row count for a table
+    Uses the InnoDB estimate from information_schema, or an exact COUNT(*) for small tables
+    """
+    with CACHE_LOCK:
+        total = COUNT_CACHE.get(table_name)
+    if total is not None:
+        return total
+    
+    total = db.execute(
+        text("SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = :db AND TABLE_NAME = :t"),
+        {"db": DB_NAME, "t": table_name}
+    ).scalar()
+    if total is None or total < EXACT_COUNT_THRESHOLD:
+        total = db.execute(select(func.count()).select_from(table)).scalar()
+    
+    with CACHE_LOCK:
+        COUNT_CACHE[table_name] = total
+    return total
+
+
+def load_table_metadata(tables: List[str]) -> None:
+    """Load columns, primary and foreign keys from the reflected schema"""
+    for table_name in tables:
+        table = get_table(table_name)
+        if table is None:
+            continue
+        TABLE_COLUMN_INFO[table_name] = [
+            {
+                "name": col.name,
+                "type": str(col.type),
+                "nullable": col.nullable,
+                "default": str(col.server_default.arg) if col.server_default is not None else None,
+                # Reflection sets True for AUTO_INCREMENT columns, otherwise "auto"
+                "autoincrement": col.autoincrement is True,
+                "comment": col.comment,
+            }
+            for col in table.columns
+        ]
+        TABLE_COLUMNS[table_name] = tuple(col.name for col in table.columns)
+        TABLE_COL_SETS[table_name] = frozenset(TABLE_COLUMNS[table_name])
+        TABLE_PKS[table_name] = tuple(col.name for col in table.primary_key.columns)
+        # Single NOT NULL columns whose values are unique, and so safe for keyset
+        # cursors; UNIQUE allows many NULLs, which sort first and never match '>'
+        unique_sets = [list(table.primary_key.columns)]
+        unique_sets += [list(index.columns) for index in table.indexes if index.unique]
+        unique_sets += [
+            list(constraint.columns) for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        ]
+        unique_sets += [[col] for col in table.columns if col.unique]
+        TABLE_UNIQUE_COLS[table_name] = frozenset(
+            cols[0].name for cols in unique_sets if len(cols) == 1 and not cols[0].nullable
+        )
+        TABLE_FKS[table_name] = [
+            {
+                "name": fk.name,
+                "constrained_columns": [col.name for col in fk.columns],
+                "referred_table": fk.referred_table.name,
+                "referred_columns": [element.column.name for element in fk.elements],
+            }
+            for fk in table.foreign_key_constraints
+        ]
 
 
-def get_table_columns(table_name: str) -> List[str]:
+def get_table_columns(table_name: str) -> Tuple[str, ...]:
     """Get column names for a table"""
-    inspector = inspect(engine)
-    columns = inspector.get_columns(table_name)
-    return [col['name'] for col in columns]
+    if table_name not in TABLE_COLUMNS:
+        load_table_metadata([table_name])
+    return TABLE_COLUMNS[table_name]
 
 
-def get_primary_keys(table_name: str) -> List[str]:
+def get_column_set(table_name: str) -> FrozenSet[str]:
+    """Get column names for a table as a set for fast membership tests"""
+    if table_name not in TABLE_COL_SETS:
+        load_table_metadata([table_name])
+    return TABLE_COL_SETS[table_name]
+
+
+def get_unique_columns(table_name: str) -> FrozenSet[str]:
+    """Get single columns with unique values for a table"""
+    if table_name not in TABLE_UNIQUE_COLS:
+        load_table_metadata([table_name])
+    return TABLE_UNIQUE_COLS[table_name]
+
+
+def get_primary_keys(table_name: str) -> Tuple[str, ...]:
     """Get primary key columns for a table"""
-    inspector = inspect(engine)
-    pk = inspector.get_pk_constraint(table_name)
-    return pk.get('constrained_columns', [])
+    if table_name not in TABLE_PKS:
+        load_table_metadata([table_name])
+    return TABLE_PKS[table_name]
+
+
+def get_foreign_keys(table_name: str) -> List[Dict[str, Any]]:
+    """Get foreign keys for a table"""
+    if table_name not in TABLE_FKS:
+        load_table_metadata([table_name])
+    return TABLE_FKS[table_name]
+
+
+def warm_statement_cache(tables: List[str]) -> None:
+    """
+    Compile the hot read statements for each table once at startup
+    The engine keeps compiled forms in its cache, so requests skip the compile step
+    """
+    with engine.connect() as conn:
+        for table_name in tables:
+            try:
+                model_class = get_model_class(table_name)
+                pk_columns = get_primary_keys(table_name)
+                if not model_class or not pk_columns:
+                    continue
+                table = model_class.__table__
+                pk_col = table.c[pk_columns[0]]
+                conn.execute(select(table).order_by(pk_col).offset(0).limit(1)).all()
+                conn.execute(select(table).where(pk_col == "0")).all()
+            except Exception:
+                conn.rollback()
+                logger.exception("Failed to warm statement cache for table '%s'", table_name)
+
+
+def _warm_tables() -> None:
+    """Load tables and metadata, retrying until the database answers, then warm caches"""
+    global AVAILABLE_TABLES, AVAILABLE_TABLES_SET, DATABASE_STATUS
+    attempt = 0
+    while not _SHUTDOWN.is_set():
+        try:
+            tables = get_all_tables()
+            load_table_metadata(tables)
+            break
+        except Exception as e:
+            attempt += 1
+            if attempt == 1:
+                # Full details once; the URL is rendered without the password
+                logger.exception("✗ Failed to connect to database")
+                logger.error("Connection string: %s", engine.url.render_as_string(hide_password=True))
+            else:
+                logger.warning("Database still unavailable (attempt %d): %s", attempt, type(e).__name__)
+            DATABASE_STATUS = "Database unavailable"
+            _SHUTDOWN.wait(STARTUP_RETRY_SECONDS)
+    else:
+        return
+    
+    AVAILABLE_TABLES_SET = frozenset(tables)
+    AVAILABLE_TABLES = tables
+    DATABASE_STATUS = "Database has no tables"
+    logger.info("✓ Database connected. Available tables: %s", tables)
+    
+    # Warmups are optimisations only; failures must not take the endpoints down
+    try:
+        warm_statement_cache(tables)
+    except Exception:
+        logger.exception("Failed to warm statement cache")
+    try:
+        warmed = warm_connection_pool()
+        logger.info("✓ Connection pool warmed with %d connections", warmed)
+    except Exception:
+        logger.exception("Failed to warm connection pool")
 
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize available tables on startup"""
-    global AVAILABLE_TABLES
-    try:
-        AVAILABLE_TABLES = get_all_tables()
-        logger.info(f"✓ Database connected. Available tables: {AVAILABLE_TABLES}")
-    except Exception as e:
-        logger.error(f"✗ Failed to connect to database: {e}")
-        logger.error(f"Connection string: {DATABASE_URL}")
+    """Initialize available tables in the background so the server accepts requests immediately"""
+    global _WARMUP_TASK
+    _WARMUP_TASK = asyncio.create_task(asyncio.to_thread(_warm_tables))
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop retrying the startup database connection"""
+    _SHUTDOWN.set()
 
 
 @app.get("/", tags=["Health"])
@@ -91,26 +354,29 @@ async def list_tables():
 
 
 @app.get("/api/tables/{table_name}/schema", tags=["Metadata"])
-async def get_table_schema(table_name: str):
+def get_table_schema(table_name: str):
     """Get schema information for a specific table"""
-    if table_name not in AVAILABLE_TABLES:
+    if not AVAILABLE_TABLES_SET:
+        raise HTTPException(status_code=503, detail=DATABASE_STATUS)
+    if table_name not in AVAILABLE_TABLES_SET:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
     
     try:
-        inspector = inspect(engine)
-        columns = inspector.get_columns(table_name)
-        pk = inspector.get_pk_constraint(table_name)
-        fk = inspector.get_foreign_keys(table_name)
+        schema = SCHEMA_CACHE.get(table_name)
+        if schema is None:
+            get_table_columns(table_name)
+            schema = {
+                "table_name": table_name,
+                "columns": TABLE_COLUMN_INFO[table_name],
+                "primary_keys": list(get_primary_keys(table_name)),
+                "foreign_keys": get_foreign_keys(table_name)
+            }
+            SCHEMA_CACHE[table_name] = schema
         
         return GenericResponse(
             success=True,
             message=f"Schema for table '{table_name}'",
-            data={
-                "table_name": table_name,
-                "columns": columns,
-                "primary_keys": pk.get('constrained_columns', []),
-                "foreign_keys": fk
-            }
+            data=schema
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -119,16 +385,23 @@ async def get_table_schema(table_name: str):
 # Dynamic CRUD Endpoints
 
 @app.get("/api/{table_name}", tags=["Read"])
-async def read_items(
+def read_items(
     table_name: str,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    order_by: Optional[str] = Query(None),
     db: Session = Depends(get_db)
 ):
     """
     Get all records from a table with pagination
+    Pass `cursor` (the previous page's `next_cursor`) for keyset pagination,
+    which seeks on the ordering column instead of scanning `skip` rows.
+    Keyset pagination requires ordering by the primary key or a unique column
     """
-    if table_name not in AVAILABLE_TABLES:
+    if not AVAILABLE_TABLES_SET:
+        raise HTTPException(status_code=503, detail=DATABASE_STATUS)
+    if table_name not in AVAILABLE_TABLES_SET:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
     
     try:
@@ -136,32 +409,113 @@ async def read_items(
         if not model_class:
             raise HTTPException(status_code=404, detail=f"Could not load model for table '{table_name}'")
         
-#        total = db.query(func.count(model_class)).scalar()
-        items = db.query(model_class).offset(skip).limit(limit).all()
-
         columns = get_table_columns(table_name)
-        serialized_items = [serialize_row(item, columns) for item in items]
+        pk_columns = get_primary_keys(table_name)
+        order_column = order_by or (pk_columns[0] if pk_columns else None)
+        if order_column is not None and order_column not in columns:
+            raise HTTPException(status_code=400, detail=f"Unknown column '{order_column}' in '{table_name}'")
+        if cursor is not None and order_column is None:
+            raise HTTPException(status_code=400, detail=f"Table '{table_name}' has no primary key")
+        keyset = order_column is not None and order_column in get_unique_columns(table_name)
+        if cursor is not None and not keyset:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cursor pagination requires ordering by a unique column, '{order_column}' is not unique"
+            )
+
+        cache_key = (table_name, skip, limit, cursor, order_column, TABLE_VERSIONS.get(table_name, 0))
+        with CACHE_LOCK:
+            data = LIST_CACHE.get(cache_key)
+        if data is not None:
+            return APIResponse({
+                "success": True,
+                "message": f"Retrieved {len(data['items'])} records from '{table_name}'",
+                "data": data,
+                "error": None
+            })
+
+        table = model_class.__table__
+        total_estimate = approximate_count(db, table_name, table)
+        stmt = select(table)
+        if order_column is not None:
+            order_col = table.c[order_column]
+            stmt = stmt.order_by(order_col)
+        if cursor is not None:
+            stmt = stmt.where(order_col > cursor).limit(limit)
+        else:
+            stmt = stmt.offset(skip).limit(limit)
+        items = db.execute(stmt).mappings().all()
+
+        serialize = _row_serializer(table_name)
+        serialized_items = [serialize(item) for item in items]
+        next_cursor = None
+        if keyset and len(serialized_items) == limit:
+            next_cursor = serialized_items[-1][order_column]
         
-        return GenericResponse(
-            success=True,
-            message=f"Retrieved {len(items)} records from '{table_name}'",
-            data={
-                "table": table_name,
-                "items": serialized_items,
- #               "total": total,
-                "skip": skip,
-                "limit": limit
-            }
-        )
+        data = {
+            "table": table_name,
+            "items": serialized_items,
+            "total_estimate": total_estimate,
+            "skip": skip,
+            "limit": limit,
+            "next_cursor": next_cursor
+        }
+        with CACHE_LOCK:
+            LIST_CACHE[cache_key] = data
+        
+        return APIResponse({
+            "success": True,
+            "message": f"Retrieved {len(items)} records from '{table_name}'",
+            "data": data,
+            "error": None
+        })
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error reading from table '{table_name}': {e}")
+        logger.exception("Error reading from table '%s'", table_name)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/{table_name}/stream", tags=["Read"])
+def stream_items(
+    table_name: str,
+    limit: Optional[int] = Query(None, ge=1),
+):
+    """
+    Stream records from a table as newline-delimited JSON
+    Rows are fetched from the database cursor in batches of STREAM_BATCH_SIZE
+    """
+    if not AVAILABLE_TABLES_SET:
+        raise HTTPException(status_code=503, detail=DATABASE_STATUS)
+    if table_name not in AVAILABLE_TABLES_SET:
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
+    
+    model_class = get_model_class(table_name)
+    if not model_class:
+        raise HTTPException(status_code=404, detail=f"Could not load model for table '{table_name}'")
+    
+    stmt = select(model_class.__table__).execution_options(yield_per=STREAM_BATCH_SIZE)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    serialize = _row_serializer(table_name)
+    
+    def generate() -> Iterator[bytes]:
+        # The session must outlive the endpoint, so the generator owns it
+        db = SessionLocal()
+        try:
+            for row in db.execute(stmt).mappings():
+                yield orjson.dumps(serialize(row), default=_orjson_default) + b"\n"
+        except Exception:
+            logger.exception("Error streaming from table '%s'", table_name)
+            raise
+        finally:
+            db.close()
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @app.get("/api/{table_name}/{record_id}", tags=["Read"])
-async def read_item(
+def read_item(
     table_name: str,
     record_id: Any,
     db: Session = Depends(get_db)
@@ -169,7 +523,9 @@ async def read_item(
     """
     Get a single record by ID
     """
-    if table_name not in AVAILABLE_TABLES:
+    if not AVAILABLE_TABLES_SET:
+        raise HTTPException(status_code=503, detail=DATABASE_STATUS)
+    if table_name not in AVAILABLE_TABLES_SET:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
     
     try:
@@ -181,29 +537,38 @@ async def read_item(
         if not pk_columns:
             raise HTTPException(status_code=400, detail=f"Table '{table_name}' has no primary key")
         
-        # Try to get by primary key
-        item = db.query(model_class).filter_by(**{pk_columns[0]: record_id}).first()
+        cache_key = (table_name, str(record_id))
+        with CACHE_LOCK:
+            serialized_item = ITEM_CACHE.get(cache_key)
         
-        if not item:
-            raise HTTPException(status_code=404, detail=f"Record not found in '{table_name}' with {pk_columns[0]}={record_id}")
-        
-        columns = get_table_columns(table_name)
-        serialized_item = serialize_row(item, columns)
+        if serialized_item is None:
+            # Try to get by primary key
+            table = model_class.__table__
+            stmt = select(table).where(table.c[pk_columns[0]] == record_id)
+            item = db.execute(stmt).mappings().first()
+            
+            if not item:
+                raise HTTPException(status_code=404, detail=f"Record not found in '{table_name}' with {pk_columns[0]}={record_id}")
+            
+            serialized_item = _row_serializer(table_name)(item)
+            with CACHE_LOCK:
+                ITEM_CACHE[cache_key] = serialized_item
         
-        return GenericResponse(
-            success=True,
-            message=f"Retrieved record from '{table_name}'",
-            data=serialized_item
-        )
+        return APIResponse({
+            "success": True,
+            "message": f"Retrieved record from '{table_name}'",
+            "data": serialized_item,
+            "error": None
+        })
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error reading record from table '{table_name}': {e}")
+        logger.exception("Error reading record from table '%s'", table_name)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/{table_name}", tags=["Create"])
-async def create_item(
+def create_item(
     table_name: str,
     item_data: Dict[str, Any],
     db: Session = Depends(get_db)
@@ -211,7 +576,9 @@ async def create_item(
     """
     Create a new record in a table
     """
-    if table_name not in AVAILABLE_TABLES:
+    if not AVAILABLE_TABLES_SET:
+        raise HTTPException(status_code=503, detail=DATABASE_STATUS)
+    if table_name not in AVAILABLE_TABLES_SET:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
     
     try:
@@ -219,11 +586,14 @@ async def create_item(
         if not model_class:
             raise HTTPException(status_code=404, detail=f"Could not load model for table '{table_name}'")
         
-        # Create new instance
+        # Create new instance, ignoring keys that are not table columns
+        cols = get_column_set(table_name)
+        item_data = {k: v for k, v in item_data.items() if k in cols}
         new_item = model_class(**item_data)
         db.add(new_item)
         db.commit()
         db.refresh(new_item)
+        invalidate_table_cache(table_name)
         
         
         columns = get_table_columns(table_name)
@@ -238,12 +608,12 @@ async def create_item(
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"Error creating record in table '{table_name}': {e}")
+        logger.exception("Error creating record in table '%s'", table_name)
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.put("/api/{table_name}/{record_id}", tags=["Update"])
-async def update_item(
+def update_item(
     table_name: str,
     record_id: Any,
     item_data: Dict[str, Any],
@@ -252,7 +622,9 @@ async def update_item(
     """
     Update an existing record
     """
-    if table_name not in AVAILABLE_TABLES:
+    if not AVAILABLE_TABLES_SET:
+        raise HTTPException(status_code=503, detail=DATABASE_STATUS)
+    if table_name not in AVAILABLE_TABLES_SET:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
     
     try:
@@ -263,23 +635,35 @@ async def update_item(
         pk_columns = get_primary_keys(table_name)
         if not pk_columns:
             raise HTTPException(status_code=400, detail=f"Table '{table_name}' has no primary key")
+        if len(pk_columns) > 1:
+            raise HTTPException(status_code=400, detail=f"Table '{table_name}' has a composite primary key; update by a single id is not supported")
+        
+        table = model_class.__table__
+        pk_col = table.c[pk_columns[0]]
+        
+        # Update fields in a single UPDATE ... WHERE pk = ?
+        cols = get_column_set(table_name)
+        clean = {k: v for k, v in item_data.items() if k in cols}
+        # The payload may change the primary key itself
+        new_id = clean.get(pk_columns[0], record_id)
+        if clean:
+            result = db.execute(update(table).where(pk_col == record_id).values(**clean))
+            if result.rowcount > 1:
+                db.rollback()
+                raise HTTPException(status_code=500, detail=f"Update matched {result.rowcount} records in '{table_name}'; rolled back")
+            db.commit()
+            invalidate_table_cache(table_name, record_id)
+            invalidate_table_cache(table_name, new_id)
+            if result.rowcount == 0:
+                raise HTTPException(status_code=404, detail=f"Record not found in '{table_name}'")
         
-        # Find the record
-        item = db.query(model_class).filter_by(**{pk_columns[0]: record_id}).first()
+        # Re-read the full row for the response
+        item = db.execute(select(table).where(pk_col == new_id)).mappings().first()
         
         if not item:
             raise HTTPException(status_code=404, detail=f"Record not found in '{table_name}'")
         
-        # Update fields
-        for key, value in item_data.items():
-            if hasattr(item, key):
-                setattr(item, key, value)
-        
-        db.commit()
-        db.refresh(item)
-        
-        columns = get_table_columns(table_name)
-        serialized_item = serialize_row(item, columns)
+        serialized_item = _row_serializer(table_name)(item)
         
         return GenericResponse(
             success=True,
@@ -290,12 +674,12 @@ async def update_item(
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"Error updating record in table '{table_name}': {e}")
+        logger.exception("Error updating record in table '%s'", table_name)
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.delete("/api/{table_name}/{record_id}", tags=["Delete"])
-async def delete_item(
+def delete_item(
     table_name: str,
     record_id: Any,
     db: Session = Depends(get_db)
@@ -303,7 +687,9 @@ async def delete_item(
     """
     Delete a record
     """
-    if table_name not in AVAILABLE_TABLES:
+    if not AVAILABLE_TABLES_SET:
+        raise HTTPException(status_code=503, detail=DATABASE_STATUS)
+    if table_name not in AVAILABLE_TABLES_SET:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
     
     try:
@@ -311,18 +697,18 @@ async def delete_item(
         if not model_class:
             raise HTTPException(status_code=404, detail=f"Could not load model for table '{table_name}'")
         
-        pk_columns = get_primary_keys(table_name)
-        if not pk_columns:
-            raise HTTPException(status_code=400, detail=f"Table '{table_name}' has no primary key")
+        if len(get_primary_keys(table_name)) > 1:
+            raise HTTPException(status_code=400, detail=f"Table '{table_name}' has a composite primary key; delete by a single id is not supported")
         
         # Find and delete
-        item = db.query(model_class).filter_by(**{pk_columns[0]: record_id}).first()
+        item = db.get(model_class, record_id)
         
         if not item:
             raise HTTPException(status_code=404, detail=f"Record not found in '{table_name}'")
         
         db.delete(item)
         db.commit()
+        invalidate_table_cache(table_name, record_id)
         
         return GenericResponse(
             success=True,
@@ -333,22 +719,31 @@ async def delete_item(
         raise
     except Exception as e:
         db.rollback()
-        logger.error(f"Error deleting record from table '{table_name}': {e}")
+        logger.exception("Error deleting record from table '%s'", table_name)
         raise HTTPException(status_code=400, detail=str(e))
 
 
 if __name__ == "__main__":
     import uvicorn
+    from config import API_WORKERS
+    
+    HOST = "10.1.2.18"
+    PORT = 8000
+    db_host = DATABASE_URL.split('@')[1]
     
-    print("=" * 60)
-    print("🚀 Starting Northwind Microserver API")
-    print("📊 Database: {DATABASE_URL.split('@')[1]}")
-    print("📖 Docs: http://10.1.2.18:8000/api/docs")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("🚀 Starting Northwind Microserver API")
+    logger.info("📊 Database: %s", db_host)
+    logger.info("📖 Docs: http://%s:%d/api/docs", HOST, PORT)
+    logger.info("=" * 60)
     
+    # Multiple workers require the app as an import string
     uvicorn.run(
-        app,
-        host="10.1.2.18",
-        port=8000,
+        "main:app",
+        host=HOST,
+        port=PORT,
+        workers=API_WORKERS,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
\ No newline at end of file
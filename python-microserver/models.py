@@ -2,7 +2,9 @@
 SQLAlchemy models auto-generated from database schema
 Models are created using reflection from existing database tables
 """
+from functools import lru_cache
 from sqlalchemy import MetaData, inspect, Table
+from sqlalchemy.ext.automap import automap_base
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import class_mapper
 from database import engine
@@ -13,16 +15,28 @@ Base = declarative_base()
 # Metadata for reflection
 metadata = MetaData()
 
+# Automap base, reflected once and shared by all requests
+_AUTOBASE = None
+
+
+def _get_autobase():
+    """
+    Return the shared automap base, reflecting the schema on first use only
+    Runs from the startup warmup thread, so importing this module does not touch the database
+    """
+    global _AUTOBASE
+    if _AUTOBASE is None:
+        AutoBase = automap_base()
+        AutoBase.prepare(engine, reflect=True)
+        _AUTOBASE = AutoBase
+    return _AUTOBASE
+
+
 def reflect_models():
     """
     Reflect all tables from the database and create model classes
     """
-    from sqlalchemy.ext.automap import automap_base
-    
-    AutoBase = automap_base()
-    AutoBase.prepare(engine, reflect=True)
-    
-    return AutoBase.registry.mappers
+    return _get_autobase().registry.mappers
 
 
 def get_all_tables():
@@ -33,33 +47,20 @@ def get_all_tables():
     return inspector.get_table_names()
 
 
+def get_table(table_name: str):
+    """
+    Get the reflected Table for a table name
+    Reuses the automap reflection, so no extra information_schema queries
+    """
+    return _get_autobase().metadata.tables.get(table_name)
+
+
+@lru_cache(maxsize=None)
 def get_model_class(table_name: str):
     """
     Dynamically get a model class for a specific table
     Uses SQLAlchemy's automap feature
     """
-    from sqlalchemy.ext.automap import automap_base
-    
-    AutoBase = automap_base()
-    AutoBase.prepare(engine, reflect=True)
-    
     # Get the model class if it exists
-    return getattr(AutoBase.classes, table_name, None)
-
+    return getattr(_get_autobase().classes, table_name, None)
 
-# Initialize auto-mapped models
-try:
-    from sqlalchemy.ext.automap import automap_base
-    
-    AutoBase = automap_base()
-    AutoBase.prepare(engine, reflect=True)
-    
-    # Create module-level references to all reflected models
-    for table_name in get_all_tables():
-        model_class = getattr(AutoBase.classes, table_name, None)
-        if model_class:
-            globals()[table_name] = model_class
-            
-except Exception as e:
-    print(f"Warning: Could not reflect models: {e}")
-    print("Models will be loaded dynamically at runtime")
\ No newline at end of file
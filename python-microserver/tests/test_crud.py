@@ -0,0 +1,103 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from fastapi.testclient import TestClient
+    from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select
+    from sqlalchemy.ext.automap import automap_base
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    import main
+    from database import get_db
+except ImportError:
+    main = None
+
+
+@unittest.skipUnless(main is not None, "microserver dependencies are not installed")
+class TestCrud(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        metadata = MetaData()
+        self.products = Table(
+            "products", metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(40)),
+        )
+        self.order_details = Table(
+            "order_details", metadata,
+            Column("order_id", Integer, primary_key=True),
+            Column("product_id", Integer, primary_key=True),
+            Column("qty", Integer),
+        )
+        metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(self.products.insert(), [{"id": 1, "name": "Chai"}, {"id": 2, "name": "Chang"}])
+            conn.execute(self.order_details.insert(), [
+                {"order_id": 1, "product_id": 1, "qty": 5},
+                {"order_id": 1, "product_id": 2, "qty": 7},
+            ])
+        self.engine = engine
+
+        AutoBase = automap_base(metadata=metadata)
+        AutoBase.prepare()
+        SessionLocal = sessionmaker(bind=engine)
+
+        def override_get_db():
+            db = SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        tables = ["order_details", "products"]
+        patches = [
+            mock.patch.object(main, "get_table", metadata.tables.get),
+            mock.patch.object(main, "get_model_class", lambda name: getattr(AutoBase.classes, name, None)),
+            mock.patch.object(main, "AVAILABLE_TABLES", tables),
+            mock.patch.object(main, "AVAILABLE_TABLES_SET", frozenset(tables)),
+        ]
+        for name in ("TABLE_COLUMNS", "TABLE_PKS", "TABLE_COLUMN_INFO", "TABLE_FKS",
+                     "TABLE_COL_SETS", "TABLE_UNIQUE_COLS", "TABLE_VERSIONS"):
+            patches.append(mock.patch.object(main, name, {}))
+        for name in ("ITEM_CACHE", "LIST_CACHE"):
+            patches.append(mock.patch.object(main, name, main.TTLCache(maxsize=100, ttl=30)))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        main._row_serializer.cache_clear()
+        self.addCleanup(main._row_serializer.cache_clear)
+
+        main.load_table_metadata(tables)
+        main.app.dependency_overrides[get_db] = override_get_db
+        self.addCleanup(main.app.dependency_overrides.clear)
+        self.client = TestClient(main.app)
+
+    def test_update_single_primary_key(self):
+        response = self.client.put("/api/products/2", json={"name": "Chang Beer"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"], {"id": 2, "name": "Chang Beer"})
+
+    def test_update_rejects_composite_primary_key(self):
+        response = self.client.put("/api/order_details/1", json={"qty": 99})
+        self.assertEqual(response.status_code, 400)
+        with self.engine.connect() as conn:
+            qtys = conn.execute(select(self.order_details.c.qty).order_by(self.order_details.c.product_id)).scalars().all()
+        self.assertEqual(qtys, [5, 7])
+
+    def test_delete_rejects_composite_primary_key(self):
+        response = self.client.delete("/api/order_details/1")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("composite primary key", response.json()["detail"])
+
+
+if __name__ == "__main__":
+    unittest.main()